@@ -9,6 +9,9 @@ import yaml
 import argparse
 import os
 
+# Prefer the libyaml backed loader when PyYAML was built against it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def read_docstring(filename):
 
@@ -61,7 +64,9 @@ def read_docstring(filename):
         # sys.stderr.write("unable to parse %s" % filename)
         return
 
-    return yaml.safe_load(data["doc"]) if data["doc"] is not None else None
+    if data["doc"] is None:
+        return None
+    return yaml.load(data["doc"], Loader=_YAML_LOADER)
 
 
 def is_extending_collection(result, col_fqcn):
@@ -18,9 +18,18 @@ except ImportError:
 
 
 class OpenShiftAdmPruneAuth(AnsibleOpenshiftModule):
+    # Results of the resource types already pruned when several are requested
+    pruned = None
+
     def __init__(self, **kwargs):
         super(OpenShiftAdmPruneAuth, self).__init__(**kwargs)
 
+    def fail_json(self, **kwargs):
+        # Report what was already deleted before failing on the next resource type.
+        if self.pruned:
+            kwargs = dict(self.pruned, **kwargs)
+        super(OpenShiftAdmPruneAuth, self).fail_json(**kwargs)
+
     def prune_resource_binding(
         self, kind, api_version, ref_kind, ref_namespace_names, propagation_policy=None
     ):
@@ -182,7 +191,7 @@ class OpenShiftAdmPruneAuth(AnsibleOpenshiftModule):
 
         roles = result.get("resources")
         if len(roles) == 0:
-            self.exit_json(
+            return dict(
                 changed=False,
                 msg="No candidate rolebinding to prune from namespace %s."
                 % self.params.get("namespace"),
@@ -197,9 +206,9 @@ class OpenShiftAdmPruneAuth(AnsibleOpenshiftModule):
             propagation_policy="Foreground",
         )
         if len(candidates) == 0:
-            self.exit_json(changed=False, role_binding=candidates)
+            return dict(changed=False, role_binding=candidates)
 
-        self.exit_json(changed=True, role_binding=candidates)
+        return dict(changed=True, role_binding=candidates)
 
     def auth_prune_clusterroles(self):
         params = {"kind": "ClusterRole", "api_version": "rbac.authorization.k8s.io/v1"}
@@ -213,7 +222,7 @@ class OpenShiftAdmPruneAuth(AnsibleOpenshiftModule):
 
         clusterroles = result.get("resources")
         if len(clusterroles) == 0:
-            self.exit_json(
+            return dict(
                 changed=False, msg="No clusterroles found matching input criteria."
             )
 
@@ -235,7 +244,7 @@ class OpenShiftAdmPruneAuth(AnsibleOpenshiftModule):
             ref_namespace_names=ref_clusterroles,
         )
 
-        self.exit_json(
+        return dict(
             changed=True,
             cluster_role_binding=candidates_cluster_binding,
             role_binding=candidates_namespaced_binding,
@@ -257,7 +266,7 @@ class OpenShiftAdmPruneAuth(AnsibleOpenshiftModule):
 
         users = self.kubernetes_facts(**params)
         if len(users) == 0:
-            self.exit_json(
+            return dict(
                 changed=False,
                 msg="No resource type 'User' found matching input criteria.",
             )
@@ -329,7 +338,7 @@ class OpenShiftAdmPruneAuth(AnsibleOpenshiftModule):
                         )
                         self.fail_json(msg=msg)
 
-        self.exit_json(
+        return dict(
             changed=changed,
             cluster_role_binding=clusterrolesbinding,
             role_binding=rolebinding,
@@ -341,7 +350,7 @@ class OpenShiftAdmPruneAuth(AnsibleOpenshiftModule):
     def auth_prune_groups(self):
         groups = self.list_groups(params=self.params)
         if len(groups) == 0:
-            self.exit_json(
+            return dict(
                 changed=False,
                 result="No resource type 'Group' found matching input criteria.",
             )
@@ -363,7 +372,7 @@ class OpenShiftAdmPruneAuth(AnsibleOpenshiftModule):
         sccs, changed_sccs = self.update_security_context(names, "groups")
         changed = changed or changed_sccs
 
-        self.exit_json(
+        return dict(
             changed=changed,
             cluster_role_binding=clusterrolesbinding,
             role_binding=rolebinding,
@@ -377,4 +386,15 @@ class OpenShiftAdmPruneAuth(AnsibleOpenshiftModule):
             "users": self.auth_prune_users,
             "groups": self.auth_prune_groups,
         }
-        auth_prune[self.params.get("resource")]()
+        resources = list(dict.fromkeys(self.params.get("resource")))
+        if len(resources) == 1:
+            results = auth_prune[resources[0]]()
+        else:
+            # Prune several resource types with the same client, the result of
+            # each one is reported under its resource type.
+            results = self.pruned = {"changed": False}
+            for resource in resources:
+                result = auth_prune[resource]()
+                results["changed"] = result.pop("changed") or results["changed"]
+                results[resource] = result
+        self.exit_json(**results)
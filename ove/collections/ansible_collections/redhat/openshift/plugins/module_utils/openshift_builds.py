@@ -14,10 +14,17 @@ from ansible_collections.redhat.openshift.plugins.module_utils.openshift_common
 )
 
 try:
+    from kubernetes import watch
+    from kubernetes.client.rest import ApiException
     from kubernetes.dynamic.exceptions import DynamicApiError
 except ImportError as e:
     pass
 
+try:
+    from urllib3.exceptions import HTTPError
+except ImportError:
+    pass
+
 
 class OpenShiftBuilds(AnsibleOpenshiftModule):
     def __init__(self, **kwargs):
@@ -33,6 +40,63 @@ class OpenShiftBuilds(AnsibleOpenshiftModule):
         result = self.kubernetes_facts(**params)
         return result["resources"]
 
+    def get_build(self, name, namespace):
+        params = dict(
+            kind="Build",
+            api_version="build.openshift.io/v1",
+            name=name,
+            namespace=namespace,
+        )
+        resources = self.kubernetes_facts(**params).get("resources", [])
+        return resources[0] if resources else None
+
+    def watch_build(self, build, phases, timeout):
+        resource = self.find_resource(
+            kind="Build", api_version="build.openshift.io/v1", fail=True
+        )
+        watcher = watch.Watch()
+        for event in resource.watch(
+            namespace=build["metadata"]["namespace"],
+            name=build["metadata"]["name"],
+            resource_version=build["metadata"]["resourceVersion"],
+            timeout=timeout,
+            watcher=watcher,
+        ):
+            if event["type"] == "DELETED":
+                watcher.stop()
+                return None
+            build = event["raw_object"]
+            if build.get("status", {}).get("phase") in phases:
+                watcher.stop()
+                break
+        return build
+
+    def wait_for_build(self, name, namespace, phases, wait_timeout, wait_sleep):
+        """
+        Wait until the Build reaches one of the given phases.
+        The Build is watched so that phase changes are seen as soon as they happen,
+        polling every wait_sleep seconds is only used when the watch is refused
+        by the API server (e.g. missing 'watch' permission on builds) or when the
+        watch connection is dropped (e.g. by a proxy closing idle connections).
+        Returns the last version of the Build seen, or None if it does not exist.
+        """
+        start = datetime.now()
+        use_watch = True
+        build = self.get_build(name, namespace)
+        while build is not None and build.get("status", {}).get("phase") not in phases:
+            remaining = wait_timeout - (datetime.now() - start).seconds
+            if remaining <= 0:
+                break
+            if use_watch:
+                try:
+                    build = self.watch_build(build, phases, remaining)
+                    continue
+                except (ApiException, HTTPError):
+                    use_watch = False
+            time.sleep(wait_sleep)
+            build = self.get_build(name, namespace)
+        return build
+
     def clone_build(self, name, namespace, request):
         try:
             result = self.request(
@@ -147,41 +211,25 @@ class OpenShiftBuilds(AnsibleOpenshiftModule):
             )
 
         if result and self.params.get("wait"):
-            start = datetime.now()
-
-            def _total_wait_time():
-                return (datetime.now() - start).seconds
-
+            name = result["metadata"]["name"]
+            namespace = result["metadata"]["namespace"]
             wait_timeout = self.params.get("wait_timeout")
             wait_sleep = self.params.get("wait_sleep")
-            last_status_phase = None
-            while _total_wait_time() < wait_timeout:
-                params = dict(
-                    kind=result["kind"],
-                    api_version=result["apiVersion"],
-                    name=result["metadata"]["name"],
-                    namespace=result["metadata"]["namespace"],
+            build = self.wait_for_build(
+                name,
+                namespace,
+                ("Complete", "Cancelled", "Error", "Failed"),
+                wait_timeout,
+                wait_sleep,
+            )
+            last_status_phase = build.get("status", {}).get("phase") if build else None
+            if last_status_phase in ("Cancelled", "Error", "Failed"):
+                self.fail_json(
+                    msg="Unexpected status for Build %s/%s: %s"
+                    % (name, namespace, last_status_phase)
                 )
-                facts = self.kubernetes_facts(**params)
-                if len(facts["resources"]) > 0:
-                    last_status_phase = facts["resources"][0]["status"]["phase"]
-                    if last_status_phase == "Complete":
-                        result = facts["resources"][0]
-                        break
-                    elif last_status_phase in ("Cancelled", "Error", "Failed"):
-                        self.fail_json(
-                            msg="Unexpected status for Build %s/%s: %s"
-                            % (
-                                result["metadata"]["name"],
-                                result["metadata"]["namespace"],
-                                last_status_phase,
-                            )
-                        )
-                time.sleep(wait_sleep)
 
             if last_status_phase != "Complete":
-                name = result["metadata"]["name"]
-                namespace = result["metadata"]["namespace"]
                 msg = (
                     "Build %s/%s has not complete after %d second(s),"
                     "current status is %s"
@@ -189,6 +237,7 @@ class OpenShiftBuilds(AnsibleOpenshiftModule):
                 )
 
                 self.fail_json(msg=msg)
+            result = build
 
         result = [result] if result else []
         self.exit_json(changed=True, builds=result)
@@ -288,21 +337,15 @@ class OpenShiftBuilds(AnsibleOpenshiftModule):
 
         # Make sure the build phase is really cancelled.
         def _wait_until_cancelled(build, wait_timeout, wait_sleep):
-            start = datetime.now()
-            last_phase = None
             name = build["metadata"]["name"]
-            while (datetime.now() - start).seconds < wait_timeout:
-                params = dict(
-                    kind=kind, api_version=api_version, name=name, namespace=namespace
-                )
-                resource = self.kubernetes_facts(**params).get("resources", [])
-                if len(resource) == 0:
-                    return None, "Build %s/%s not found" % (namespace, name)
-                resource = resource[0]
-                last_phase = resource["status"]["phase"]
-                if last_phase == "Cancelled":
-                    return resource, None
-                time.sleep(wait_sleep)
+            resource = self.wait_for_build(
+                name, namespace, ("Cancelled",), wait_timeout, wait_sleep
+            )
+            if resource is None:
+                return None, "Build %s/%s not found" % (namespace, name)
+            last_phase = resource.get("status", {}).get("phase")
+            if last_phase == "Cancelled":
+                return resource, None
             return (
                 None,
                 "Build %s/%s is not cancelled as expected, current state is %s"
@@ -6,6 +6,7 @@ __metaclass__ = type
 
 import traceback
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible.module_utils._text import to_native
 
@@ -41,6 +42,9 @@ except ImportError as e:
     k8s_collection_import_exception = e
     K8S_COLLECTION_ERROR = traceback.format_exc()
 
+# Upper bound on concurrent requests sent to the API server by run_concurrently().
+MAX_CONCURRENT_REQUESTS = 8
+
 
 class AnsibleOpenshiftModule(AnsibleK8SModule):
     def __init__(self, **kwargs):
@@ -71,6 +75,33 @@ class AnsibleOpenshiftModule(AnsibleK8SModule):
     def request(self, *args, **kwargs):
         return self.client.client.request(*args, **kwargs)
 
+    def run_concurrently(self, func, items, on_error):
+        """
+        Call func on each item using a small thread pool, for independent API
+        requests. Returns the results in the order of items.
+        Failures are reported from the main thread once all calls have completed,
+        on_error(item, exc) returns the arguments passed to fail_json for the
+        first failed item, the results of the successful calls are added to them
+        as 'result' so that the changes already made are reported.
+        """
+        if not items:
+            return []
+        max_workers = min(MAX_CONCURRENT_REQUESTS, len(items))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(func, item) for item in items]
+
+        results = []
+        failure = None
+        for item, future in zip(items, futures):
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                if failure is None:
+                    failure = on_error(item, exc)
+        if failure is not None:
+            self.fail_json(result=results, **failure)
+        return results
+
     def set_resource_definitions(self):
         self.resource_definitions = create_definitions(self.params)
 
@@ -121,8 +121,8 @@ class OpenshiftLDAPGroups(object):
             return result["resources"]
 
     def list_groups(self):
-        allow_groups = self.module.params.get("allow_groups")
-        deny_groups = self.module.params.get("deny_groups")
+        allow_groups = self.module.params.get("allow_groups") or []
+        deny_groups = self.module.params.get("deny_groups") or []
         name_mapping = self.module.config.get("groupUIDNameMapping")
 
         if name_mapping and (allow_groups or deny_groups):
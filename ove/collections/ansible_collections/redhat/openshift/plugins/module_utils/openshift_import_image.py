@@ -387,26 +387,27 @@ class OpenShiftImportImage(AnsibleOpenshiftModule):
         kind = "ImageStreamImport"
         api_version = "image.openshift.io/v1"
         namespace = self.params.get("namespace")
-        try:
-            resource = self.find_resource(kind=kind, api_version=api_version, fail=True)
-            result = []
-            for isi in images_imports:
-                if not self.check_mode:
-                    isi = resource.create(isi, namespace=namespace).to_dict()
-                result.append(isi)
-            self.exit_json(changed=True, result=result)
-        except DynamicApiError as exc:
-            msg = "Failed to create object {kind}/{namespace}/{name} due to: {error}".format(
-                kind=kind, namespace=namespace, name=isi["metadata"]["name"], error=exc
-            )
-            self.fail_json(
-                msg=msg,
-                error=exc.status,
-                status=exc.status,
-                reason=exc.reason,
-            )
-        except Exception as exc:
+        resource = self.find_resource(kind=kind, api_version=api_version, fail=True)
+        if self.check_mode:
+            self.exit_json(changed=True, result=images_imports)
+
+        def _create(isi):
+            return resource.create(isi, namespace=namespace).to_dict()
+
+        def _on_error(isi, exc):
             msg = "Failed to create object {kind}/{namespace}/{name} due to: {error}".format(
-                kind=kind, namespace=namespace, name=isi["metadata"]["name"], error=exc
+                kind=kind,
+                namespace=namespace,
+                name=isi["metadata"]["name"],
+                error=exc,
             )
-            self.fail_json(msg=msg)
+            if isinstance(exc, DynamicApiError):
+                return dict(
+                    msg=msg, error=exc.status, status=exc.status, reason=exc.reason
+                )
+            return dict(msg=msg)
+
+        # An ImageStreamImport only targets a single ImageStream, one is
+        # created per stream.
+        result = self.run_concurrently(_create, images_imports, _on_error)
+        self.exit_json(changed=True, result=result)
@@ -10,6 +10,7 @@ from ansible.module_utils._text import to_native
 
 from ansible_collections.redhat.openshift.plugins.module_utils.openshift_common import (
     AnsibleOpenshiftModule,
+    create_definitions,
 )
 
 try:
@@ -17,11 +18,38 @@ try:
 except ImportError:
     pass
 
+try:
+    import yaml
+except ImportError:
+    # Handled in module setup
+    yaml = None
+
+# Prefer the libyaml backed loader, it is much faster on large templates.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", getattr(yaml, "SafeLoader", None))
+
 
 class OpenShiftProcess(AnsibleOpenshiftModule):
     def __init__(self, **kwargs):
         super(OpenShiftProcess, self).__init__(**kwargs)
 
+    def set_resource_definitions(self):
+        # Parse a local src file here so that _YAML_LOADER is used, anything
+        # else is left to kubernetes.core.
+        src = self.params.get("src")
+        if (
+            _YAML_LOADER
+            and src
+            and not self.params.get("resource_definition")
+            and os.path.isfile(src)
+        ):
+            with open(src, "rb") as f:
+                definitions = [d for d in yaml.load_all(f, Loader=_YAML_LOADER) if d]
+            if definitions:
+                params = dict(self.params, src=None, resource_definition=definitions)
+                self.resource_definitions = create_definitions(params)
+                return
+        super(OpenShiftProcess, self).set_resource_definitions()
+
     def execute_module(self):
         v1_templates = self.find_resource(
             "templates", "template.openshift.io/v1", fail=True
@@ -593,53 +593,53 @@ from ansible_collections.kubernetes.core.plugins.module_utils.args_common import
     DELETE_OPTS_ARG_SPEC,
 )
 
+_VALIDATE_SPEC = dict(
+    fail_on_error=dict(type="bool"),
+    version=dict(),
+    strict=dict(type="bool", default=True),
+)
+
+_ARGSPEC = {
+    **NAME_ARG_SPEC,
+    **RESOURCE_ARG_SPEC,
+    **AUTH_ARG_SPEC,
+    **WAIT_ARG_SPEC,
+    "merge_type": dict(
+        type="list", elements="str", choices=["merge", "strategic-merge"]
+    ),
+    "validate": dict(type="dict", default=None, options=_VALIDATE_SPEC),
+    "append_hash": dict(type="bool", default=False),
+    "apply": dict(type="bool", default=False),
+    "template": dict(type="raw", default=None),
+    "delete_options": dict(type="dict", default=None, options=DELETE_OPTS_ARG_SPEC),
+    "continue_on_error": dict(type="bool", default=False),
+    "state": dict(default="present", choices=["present", "absent", "patched"]),
+    "force": dict(type="bool", default=False),
+}
+
+_MUTUALLY_EXCLUSIVE = (
+    ("resource_definition", "src"),
+    ("merge_type", "apply"),
+    ("template", "resource_definition"),
+    ("template", "src"),
+)
+
 
 def validate_spec():
-    return dict(
-        fail_on_error=dict(type="bool"),
-        version=dict(),
-        strict=dict(type="bool", default=True),
-    )
+    return _VALIDATE_SPEC
 
 
 def argspec():
-    argument_spec = {}
-    argument_spec.update(NAME_ARG_SPEC)
-    argument_spec.update(RESOURCE_ARG_SPEC)
-    argument_spec.update(AUTH_ARG_SPEC)
-    argument_spec.update(WAIT_ARG_SPEC)
-    argument_spec["merge_type"] = dict(
-        type="list", elements="str", choices=["merge", "strategic-merge"]
-    )
-    argument_spec["validate"] = dict(type="dict", default=None, options=validate_spec())
-    argument_spec["append_hash"] = dict(type="bool", default=False)
-    argument_spec["apply"] = dict(type="bool", default=False)
-    argument_spec["template"] = dict(type="raw", default=None)
-    argument_spec["delete_options"] = dict(
-        type="dict", default=None, options=DELETE_OPTS_ARG_SPEC
-    )
-    argument_spec["continue_on_error"] = dict(type="bool", default=False)
-    argument_spec["state"] = dict(
-        default="present", choices=["present", "absent", "patched"]
-    )
-    argument_spec["force"] = dict(type="bool", default=False)
-    return argument_spec
+    return _ARGSPEC
 
 
 def main():
-    mutually_exclusive = [
-        ("resource_definition", "src"),
-        ("merge_type", "apply"),
-        ("template", "resource_definition"),
-        ("template", "src"),
-    ]
-
     from ansible_collections.redhat.openshift.plugins.module_utils.k8s import OKDRawModule
 
     module = OKDRawModule(
         argument_spec=argspec(),
         supports_check_mode=True,
-        mutually_exclusive=mutually_exclusive,
+        mutually_exclusive=_MUTUALLY_EXCLUSIVE,
     )
     module.run_module()
 
@@ -24,7 +24,6 @@ notes:
   the kubeconfig file.
 options:
   allow_groups:
-    default: []
     description:
     - Allowed groups, could be openshift group name or LDAP group dn value.
     - When parameter C(type) is set to I(ldap) this should contains only LDAP group
@@ -64,7 +63,6 @@ options:
       environment variable.
     type: str
   deny_groups:
-    default: []
     description:
     - Denied groups, could be openshift group name or LDAP group dn value.
     - When parameter C(type) is set to I(ldap) this should contains only LDAP group
@@ -320,25 +318,22 @@ RETURN = r"""builds:
 """
 
 
-import copy
-
 from ansible_collections.kubernetes.core.plugins.module_utils.args_common import (
     AUTH_ARG_SPEC,
 )
 
+_ARGUMENT_SPEC = {
+    **AUTH_ARG_SPEC,
+    "state": dict(type="str", choices=["absent", "present"], default="present"),
+    "type": dict(type="str", choices=["ldap", "openshift"], default="ldap"),
+    "sync_config": dict(type="dict", aliases=["config", "src"], required=True),
+    "deny_groups": dict(type="list", elements="str"),
+    "allow_groups": dict(type="list", elements="str"),
+}
+
 
 def argument_spec():
-    args = copy.deepcopy(AUTH_ARG_SPEC)
-    args.update(
-        dict(
-            state=dict(type="str", choices=["absent", "present"], default="present"),
-            type=dict(type="str", choices=["ldap", "openshift"], default="ldap"),
-            sync_config=dict(type="dict", aliases=["config", "src"], required=True),
-            deny_groups=dict(type="list", elements="str", default=[]),
-            allow_groups=dict(type="list", elements="str", default=[]),
-        )
-    )
-    return args
+    return _ARGUMENT_SPEC
 
 
 def main():
@@ -346,9 +341,7 @@ def main():
         OpenshiftGroupsSync,
     )
 
-    module = OpenshiftGroupsSync(
-        argument_spec=argument_spec(), supports_check_mode=True
-    )
+    module = OpenshiftGroupsSync(argument_spec=_ARGUMENT_SPEC, supports_check_mode=True)
     module.run_module()
 
 
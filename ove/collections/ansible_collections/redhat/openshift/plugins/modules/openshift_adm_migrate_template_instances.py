@@ -248,8 +248,11 @@ EXAMPLES = """
 RETURN = r"""result:
   description:
   - List with all TemplateInstances that have been migrated.
+  - The TemplateInstances are patched concurrently. When one of them fails, the
+    others are still patched and the ones that succeeded are returned along with
+    the error.
   elements: dict
-  returned: success
+  returned: success or failure
   sample:
   - apiVersion: template.openshift.io/v1
     kind: TemplateInstance
@@ -385,61 +388,145 @@ from ansible_collections.kubernetes.core.plugins.module_utils.args_common import
     WAIT_ARG_SPEC,
 )
 
+# Number of TemplateInstances requested per list call.
+LIST_PAGE_SIZE = 500
+
 transforms = {
     "Build": "build.openshift.io/v1",
     "BuildConfig": "build.openshift.io/v1",
     "DeploymentConfig": "apps.openshift.io/v1",
     "Route": "route.openshift.io/v1",
 }
+_TRANSFORMS_GET = transforms.get
+
+
+def migration_target(ref):
+    target = _TRANSFORMS_GET(ref["kind"])
+    if target is not None and ref.get("apiVersion") != target:
+        return target
+    return None
+
+
+def migration_patch(templateinstance):
+    # JSON patch (RFC 6902) setting the apiVersion of every object reference
+    # handled by transforms, guarded by the resourceVersion the migration was
+    # computed from.
+    patch = []
+    resource_version = templateinstance["metadata"].get("resourceVersion")
+    if resource_version:
+        patch.append(
+            {
+                "op": "test",
+                "path": "/metadata/resourceVersion",
+                "value": resource_version,
+            }
+        )
+    for i, obj in enumerate(templateinstance["status"]["objects"]):
+        target = _TRANSFORMS_GET(obj["ref"]["kind"])
+        if target is not None:
+            patch.append(
+                {
+                    "op": "add",
+                    "path": "/status/objects/{0}/ref/apiVersion".format(i),
+                    "value": target,
+                }
+            )
+    return patch
 
 
 class OpenShiftMigrateTemplateInstances(AnsibleOpenshiftModule):
     def __init__(self, **kwargs):
         super(OpenShiftMigrateTemplateInstances, self).__init__(**kwargs)
 
-    def patch_template_instance(self, resource, templateinstance):
-        result = None
-
-        try:
-            result = resource.status.patch(templateinstance)
-        except Exception as exc:
-            self.fail_json(
+    def patch_template_instances(self, resource, templateinstances):
+        def _patch(templateinstance):
+            return resource.status.patch(
+                body=migration_patch(templateinstance),
+                name=templateinstance["metadata"]["name"],
+                namespace=templateinstance["metadata"].get("namespace"),
+                content_type="application/json-patch+json",
+            ).to_dict()
+
+        def _on_error(templateinstance, exc):
+            return dict(
                 msg="Failed to migrate TemplateInstance {0} due to: {1}".format(
                     templateinstance["metadata"]["name"], to_native(exc)
                 )
             )
 
-        return result.to_dict()
+        return self.run_concurrently(_patch, templateinstances, _on_error)
 
     @staticmethod
     def perform_migrations(templateinstances):
-        ti_list = []
         ti_to_be_migrated = []
 
-        ti_list = (
-            templateinstances.get("kind") == "TemplateInstanceList"
-            and templateinstances.get("items")
-            or [templateinstances]
-        )
+        if templateinstances.get("kind") == "TemplateInstanceList":
+            ti_list = templateinstances.get("items") or []
+        else:
+            ti_list = [templateinstances]
 
         for ti_elem in ti_list:
-            objects = ti_elem["status"].get("objects")
-            if objects:
-                for i, obj in enumerate(objects):
-                    object_type = obj["ref"]["kind"]
-                    if (
-                        object_type in transforms.keys()
-                        and obj["ref"].get("apiVersion") != transforms[object_type]
-                    ):
-                        ti_elem["status"]["objects"][i]["ref"]["apiVersion"] = (
-                            transforms[object_type]
-                        )
-                        ti_to_be_migrated.append(ti_elem)
+            # TemplateInstances still being instantiated have no status yet
+            status = ti_elem.get("status")
+            objects = status.get("objects") if status else None
+            if not objects:
+                continue
+            targets = [migration_target(obj["ref"]) for obj in objects]
+            if not any(targets):
+                continue
+            # Only convert the TemplateInstances which need to be patched
+            # when working on the ResourceInstance from the dynamic client.
+            if not isinstance(ti_elem, dict):
+                ti_elem = ti_elem.to_dict()
+            for obj, target in zip(ti_elem["status"]["objects"], targets):
+                if target:
+                    obj["ref"]["apiVersion"] = target
+            ti_to_be_migrated.append(ti_elem)
 
         return ti_to_be_migrated
 
+    def list_template_instances(self, resource, namespace=None):
+        # Retrieve TemplateInstances one page at a time so that only a single
+        # page has to be held in memory while it is being migrated.
+        _continue = None
+        while True:
+            if namespace:
+                # Get TemplateInstances from a provided namespace
+                try:
+                    templateinstances = resource.get(
+                        namespace=namespace, limit=LIST_PAGE_SIZE, _continue=_continue
+                    )
+                except DynamicApiError as exc:
+                    self.fail_json(
+                        msg="Failed to retrieve TemplateInstances in namespace '{0}': {1}".format(
+                            namespace, exc.body
+                        ),
+                        error=exc.status,
+                        status=exc.status,
+                        reason=exc.reason,
+                    )
+                except Exception as exc:
+                    self.fail_json(
+                        msg="Failed to retrieve TemplateInstances in namespace '{0}': {1}".format(
+                            namespace, to_native(exc)
+                        ),
+                        error="",
+                        status="",
+                        reason="",
+                    )
+            else:
+                # Get TemplateInstances from all namespaces
+                templateinstances = resource.get(
+                    limit=LIST_PAGE_SIZE, _continue=_continue
+                )
+
+            yield templateinstances
+
+            _continue = templateinstances.get("metadata", {}).get("continue")
+            if not _continue:
+                break
+
     def execute_module(self):
-        templateinstances = None
         namespace = self.params.get("namespace")
         results = {"changed": False, "result": []}
 
@@ -447,43 +534,18 @@ class OpenShiftMigrateTemplateInstances(AnsibleOpenshiftModule):
             "templateinstances", "template.openshift.io/v1", fail=True
         )
 
-        if namespace:
-            # Get TemplateInstances from a provided namespace
-            try:
-                templateinstances = resource.get(namespace=namespace).to_dict()
-            except DynamicApiError as exc:
-                self.fail_json(
-                    msg="Failed to retrieve TemplateInstances in namespace '{0}': {1}".format(
-                        namespace, exc.body
-                    ),
-                    error=exc.status,
-                    status=exc.status,
-                    reason=exc.reason,
-                )
-            except Exception as exc:
-                self.fail_json(
-                    msg="Failed to retrieve TemplateInstances in namespace '{0}': {1}".format(
-                        namespace, to_native(exc)
-                    ),
-                    error="",
-                    status="",
-                    reason="",
+        ti_to_be_migrated = []
+        for templateinstances in self.list_template_instances(resource, namespace):
+            ti_to_be_migrated.extend(self.perform_migrations(templateinstances))
+
+        if ti_to_be_migrated:
+            if self.check_mode:
+                self.exit_json(**{"changed": True, "result": ti_to_be_migrated})
+            else:
+                results["result"] = self.patch_template_instances(
+                    resource, ti_to_be_migrated
                 )
-        else:
-            # Get TemplateInstances from all namespaces
-            templateinstances = resource.get().to_dict()
-
-            ti_to_be_migrated = self.perform_migrations(templateinstances)
-
-            if ti_to_be_migrated:
-                if self.check_mode:
-                    self.exit_json(**{"changed": True, "result": ti_to_be_migrated})
-                else:
-                    for ti_elem in ti_to_be_migrated:
-                        results["result"].append(
-                            self.patch_template_instance(resource, ti_elem)
-                        )
-                    results["changed"] = True
+                results["changed"] = True
 
         self.exit_json(**results)
 
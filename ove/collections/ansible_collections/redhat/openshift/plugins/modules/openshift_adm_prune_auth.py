@@ -174,8 +174,14 @@ options:
     - groups
     description:
     - The specified resource to remove.
+    - When several resources are specified, they are pruned in turn reusing the same
+      API client, and the result for each of them is returned under a key named after
+      the resource.
+    - If pruning one of the resources fails, the module fails but still returns the
+      result of the resources already pruned.
+    elements: str
     required: true
-    type: str
+    type: list
   username:
     description:
     - Provide a username for authenticating with the API. Can also be specified via
@@ -213,44 +219,112 @@ EXAMPLES = """
     namespace: testing
     label_selectors:
       - phase=production
+
+- name: Prune users and groups in a single task
+  openshift_adm_prune_auth:
+    resource:
+      - users
+      - groups
+    label_selectors:
+      - phase=production
 """
 
 RETURN = r"""authorization:
   description: list of OAuthClientAuthorization deleted.
-  returned: I(resource=users)
+  returned: when I(resource) is C(users) only
   type: list
 cluster_role_binding:
   description: list of cluster role binding deleted.
-  returned: always
+  returned: when I(resource) is one of C(clusterroles), C(users) or C(groups) only
   type: list
 group:
   description: list of Security Context Constraints deleted.
-  returned: I(resource=users)
+  returned: when I(resource) is C(users) only
   type: list
 role_binding:
   description: list of role binding deleted.
-  returned: I(resource=users) or I(resource=groups) or I(resource=clusterroles)
+  returned: when I(resource) has a single item
   type: list
 security_context_constraints:
   description: list of Security Context Constraints deleted.
-  returned: I(resource=users) or I(resource=groups)
+  returned: when I(resource) is C(users) or C(groups) only
   type: list
+roles:
+  description:
+  - Result of pruning the roles, with the keys returned for I(resource=roles).
+  - Also returned on failure when the roles were pruned before the failing resource.
+  returned: when I(resource) contains C(roles) and at least one other item
+  type: dict
+  contains:
+    role_binding:
+      description: list of role binding deleted.
+      type: list
+clusterroles:
+  description:
+  - Result of pruning the cluster roles, with the keys returned for I(resource=clusterroles).
+  - Also returned on failure when the cluster roles were pruned before the failing resource.
+  returned: when I(resource) contains C(clusterroles) and at least one other item
+  type: dict
+  contains:
+    cluster_role_binding:
+      description: list of cluster role binding deleted.
+      type: list
+    role_binding:
+      description: list of role binding deleted.
+      type: list
+users:
+  description:
+  - Result of pruning the users, with the keys returned for I(resource=users).
+  - Also returned on failure when the users were pruned before the failing resource.
+  returned: when I(resource) contains C(users) and at least one other item
+  type: dict
+  contains:
+    authorization:
+      description: list of OAuthClientAuthorization deleted.
+      type: list
+    cluster_role_binding:
+      description: list of cluster role binding deleted.
+      type: list
+    group:
+      description: list of Security Context Constraints deleted.
+      type: list
+    role_binding:
+      description: list of role binding deleted.
+      type: list
+    security_context_constraints:
+      description: list of Security Context Constraints deleted.
+      type: list
+groups:
+  description:
+  - Result of pruning the groups, with the keys returned for I(resource=groups).
+  - Also returned on failure when the groups were pruned before the failing resource.
+  returned: when I(resource) contains C(groups) and at least one other item
+  type: dict
+  contains:
+    cluster_role_binding:
+      description: list of cluster role binding deleted.
+      type: list
+    role_binding:
+      description: list of role binding deleted.
+      type: list
+    security_context_constraints:
+      description: list of Security Context Constraints deleted.
+      type: list
 """
 
 
-import copy
-
 from ansible_collections.kubernetes.core.plugins.module_utils.args_common import (
     AUTH_ARG_SPEC,
 )
 
 
 def argument_spec():
-    args = copy.deepcopy(AUTH_ARG_SPEC)
+    args = dict(AUTH_ARG_SPEC)
     args.update(
         dict(
             resource=dict(
-                type="str",
+                type="list",
+                elements="str",
                 required=True,
                 choices=["roles", "clusterroles", "users", "groups"],
             ),
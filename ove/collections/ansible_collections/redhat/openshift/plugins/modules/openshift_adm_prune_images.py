@@ -376,29 +376,26 @@ updated_image_streams:
 """
 
 
-import copy
-
 from ansible_collections.kubernetes.core.plugins.module_utils.args_common import (
     AUTH_ARG_SPEC,
 )
 
+_ARGUMENT_SPEC = {
+    **AUTH_ARG_SPEC,
+    "namespace": dict(type="str"),
+    "all_images": dict(type="bool", default=True),
+    "keep_younger_than": dict(type="int"),
+    "prune_over_size_limit": dict(type="bool", default=False),
+    "registry_url": dict(type="str"),
+    "registry_validate_certs": dict(type="bool"),
+    "registry_ca_cert": dict(type="path"),
+    "prune_registry": dict(type="bool", default=True),
+    "ignore_invalid_refs": dict(type="bool", default=False),
+}
+
 
 def argument_spec():
-    args = copy.deepcopy(AUTH_ARG_SPEC)
-    args.update(
-        dict(
-            namespace=dict(type="str"),
-            all_images=dict(type="bool", default=True),
-            keep_younger_than=dict(type="int"),
-            prune_over_size_limit=dict(type="bool", default=False),
-            registry_url=dict(type="str"),
-            registry_validate_certs=dict(type="bool"),
-            registry_ca_cert=dict(type="path"),
-            prune_registry=dict(type="bool", default=True),
-            ignore_invalid_refs=dict(type="bool", default=False),
-        )
-    )
-    return args
+    return _ARGUMENT_SPEC
 
 
 def main():
@@ -407,7 +404,7 @@ def main():
     )
 
     module = OpenShiftAdmPruneImages(
-        argument_spec=argument_spec(), supports_check_mode=True
+        argument_spec=_ARGUMENT_SPEC, supports_check_mode=True
     )
     module.run_module()
 
@@ -345,47 +345,45 @@ RETURN = r"""builds:
 """
 
 
-import copy
-
 from ansible_collections.kubernetes.core.plugins.module_utils.args_common import (
     AUTH_ARG_SPEC,
 )
 
+_ARGS_OPTIONS = {
+    "name": {"type": "str", "required": True},
+    "value": {"type": "str", "required": True},
+}
 
-def argument_spec():
-    args = copy.deepcopy(AUTH_ARG_SPEC)
 
-    args_options = dict(
-        name=dict(type="str", required=True), value=dict(type="str", required=True)
-    )
+_ARGUMENT_SPEC = {
+    **AUTH_ARG_SPEC,
+    "state": dict(
+        type="str",
+        choices=["started", "cancelled", "restarted"],
+        default="started",
+    ),
+    "build_args": dict(type="list", elements="dict", options=_ARGS_OPTIONS),
+    "commit": dict(type="str"),
+    "env_vars": dict(type="list", elements="dict", options=_ARGS_OPTIONS),
+    "build_name": dict(type="str"),
+    "build_config_name": dict(type="str"),
+    "namespace": dict(type="str", required=True),
+    "incremental": dict(type="bool"),
+    "no_cache": dict(type="bool"),
+    "wait": dict(type="bool", default=False),
+    "wait_sleep": dict(type="int", default=5),
+    "wait_timeout": dict(type="int", default=120),
+    "build_phases": dict(
+        type="list",
+        elements="str",
+        default=[],
+        choices=["New", "Pending", "Running"],
+    ),
+}
 
-    args.update(
-        dict(
-            state=dict(
-                type="str",
-                choices=["started", "cancelled", "restarted"],
-                default="started",
-            ),
-            build_args=dict(type="list", elements="dict", options=args_options),
-            commit=dict(type="str"),
-            env_vars=dict(type="list", elements="dict", options=args_options),
-            build_name=dict(type="str"),
-            build_config_name=dict(type="str"),
-            namespace=dict(type="str", required=True),
-            incremental=dict(type="bool"),
-            no_cache=dict(type="bool"),
-            wait=dict(type="bool", default=False),
-            wait_sleep=dict(type="int", default=5),
-            wait_timeout=dict(type="int", default=120),
-            build_phases=dict(
-                type="list",
-                elements="str",
-                default=[],
-                choices=["New", "Pending", "Running"],
-            ),
-        )
-    )
-    return args
+
+def argument_spec():
+    return _ARGUMENT_SPEC
 
 
 def main():
@@ -397,7 +395,7 @@ def main():
     )
 
     module = OpenShiftBuilds(
-        argument_spec=argument_spec(),
+        argument_spec=_ARGUMENT_SPEC,
         mutually_exclusive=mutually_exclusive,
         required_one_of=[
             [
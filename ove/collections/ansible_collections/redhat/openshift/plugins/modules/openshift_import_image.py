@@ -292,35 +292,33 @@ RETURN = r"""result:
       type: dict
   description:
   - List with all ImageStreamImport that have been created.
+  - The ImageStreamImports are created concurrently. When one of them fails, the
+    others are still created and the ones that succeeded are returned along with
+    the error.
   elements: dict
-  returned: success
+  returned: success or failure
   type: list
 """
 
 
-import copy
-
 from ansible_collections.kubernetes.core.plugins.module_utils.args_common import (
     AUTH_ARG_SPEC,
 )
 
+_ARGUMENT_SPEC = {
+    **AUTH_ARG_SPEC,
+    "namespace": dict(type="str", required=True),
+    "name": dict(type="raw", required=True),
+    "all": dict(type="bool", default=False),
+    "validate_registry_certs": dict(type="bool"),
+    "reference_policy": dict(type="str", choices=["source", "local"], default="source"),
+    "scheduled": dict(type="bool", default=False),
+    "source": dict(type="str"),
+}
+
 
 def argument_spec():
-    args = copy.deepcopy(AUTH_ARG_SPEC)
-    args.update(
-        dict(
-            namespace=dict(type="str", required=True),
-            name=dict(type="raw", required=True),
-            all=dict(type="bool", default=False),
-            validate_registry_certs=dict(type="bool"),
-            reference_policy=dict(
-                type="str", choices=["source", "local"], default="source"
-            ),
-            scheduled=dict(type="bool", default=False),
-            source=dict(type="str"),
-        )
-    )
-    return args
+    return _ARGUMENT_SPEC
 
 
 def main():
@@ -329,7 +327,7 @@ def main():
     )
 
     module = OpenShiftImportImage(
-        argument_spec=argument_spec(), supports_check_mode=True
+        argument_spec=_ARGUMENT_SPEC, supports_check_mode=True
     )
     module.run_module()
 
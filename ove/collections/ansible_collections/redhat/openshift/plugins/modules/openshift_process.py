@@ -438,26 +438,31 @@ result:
 """
 
 
-from ansible_collections.kubernetes.core.plugins.module_utils.args_common import (
-    AUTH_ARG_SPEC,
-    RESOURCE_ARG_SPEC,
-    WAIT_ARG_SPEC,
-)
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
 def argspec():
+    from ansible_collections.kubernetes.core.plugins.module_utils.args_common import (
+        AUTH_ARG_SPEC,
+        RESOURCE_ARG_SPEC,
+        WAIT_ARG_SPEC,
+    )
+
     argument_spec = {}
     argument_spec.update(AUTH_ARG_SPEC)
     argument_spec.update(WAIT_ARG_SPEC)
     argument_spec.update(RESOURCE_ARG_SPEC)
-    argument_spec["state"] = dict(
-        type="str", default="rendered", choices=["present", "absent", "rendered"]
-    )
-    argument_spec["namespace"] = dict(type="str")
-    argument_spec["namespace_target"] = dict(type="str")
-    argument_spec["parameters"] = dict(type="dict")
-    argument_spec["name"] = dict(type="str")
-    argument_spec["parameter_file"] = dict(type="str")
+    argument_spec["state"] = {
+        "type": "str",
+        "default": "rendered",
+        "choices": ["present", "absent", "rendered"],
+    }
+    argument_spec["namespace"] = {"type": "str"}
+    argument_spec["namespace_target"] = {"type": "str"}
+    argument_spec["parameters"] = {"type": "dict"}
+    argument_spec["name"] = {"type": "str"}
+    argument_spec["parameter_file"] = {"type": "str"}
 
     return argument_spec
 
@@ -0,0 +1,83 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ansible_collections.redhat.openshift.plugins.module_utils.openshift_adm_prune_auth import (
+    OpenShiftAdmPruneAuth,
+)
+from ansible_collections.redhat.openshift.tests.unit.utils.ansible_module_mock import (
+    AnsibleExitJson,
+    AnsibleFailJson,
+    create_module,
+)
+
+
+def _prune_auth_module(resource):
+    module = create_module(OpenShiftAdmPruneAuth, {"resource": resource})
+    module.auth_prune_roles = MagicMock(
+        return_value=dict(changed=False, role_binding=[])
+    )
+    module.auth_prune_users = MagicMock(
+        return_value=dict(
+            changed=True,
+            cluster_role_binding=[],
+            role_binding=["test/user-binding"],
+            security_context_constraints=[],
+            authorization=[],
+            group=[],
+        )
+    )
+    return module
+
+
+def test_prune_auth_single_resource():
+    module = _prune_auth_module(["roles"])
+
+    with pytest.raises(AnsibleExitJson) as result:
+        module.execute_module()
+
+    assert result.value.args[0] == {"changed": False, "role_binding": []}
+    module.auth_prune_users.assert_not_called()
+
+
+def test_prune_auth_multiple_resources():
+    module = _prune_auth_module(["users", "roles", "users"])
+
+    with pytest.raises(AnsibleExitJson) as result:
+        module.execute_module()
+
+    assert result.value.args[0] == {
+        "changed": True,
+        "users": {
+            "cluster_role_binding": [],
+            "role_binding": ["test/user-binding"],
+            "security_context_constraints": [],
+            "authorization": [],
+            "group": [],
+        },
+        "roles": {"role_binding": []},
+    }
+    module.auth_prune_users.assert_called_once_with()
+    module.auth_prune_roles.assert_called_once_with()
+
+
+def test_prune_auth_multiple_resources_failure():
+    module = _prune_auth_module(["roles", "users"])
+    module.auth_prune_users.side_effect = lambda: module.fail_json(
+        msg="Failed to delete user"
+    )
+
+    with pytest.raises(AnsibleFailJson) as result:
+        module.execute_module()
+
+    assert result.value.args[0] == {
+        "failed": True,
+        "msg": "Failed to delete user",
+        "changed": False,
+        "roles": {"role_binding": []},
+    }
@@ -0,0 +1,214 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("kubernetes", reason="This test requires the kubernetes library")
+
+from kubernetes.client.rest import ApiException
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+from ansible_collections.redhat.openshift.plugins.module_utils import openshift_builds
+from ansible_collections.redhat.openshift.plugins.module_utils.openshift_builds import (
+    OpenShiftBuilds,
+)
+from ansible_collections.redhat.openshift.tests.unit.utils.ansible_module_mock import (
+    AnsibleExitJson,
+    AnsibleFailJson,
+    create_module,
+)
+
+
+def _build(phase, resource_version="1"):
+    return {
+        "kind": "Build",
+        "apiVersion": "build.openshift.io/v1",
+        "metadata": {
+            "name": "build-1",
+            "namespace": "test",
+            "resourceVersion": resource_version,
+        },
+        "status": {"phase": phase},
+    }
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    monkeypatch.setattr(openshift_builds.time, "sleep", MagicMock())
+    module = create_module(OpenShiftBuilds, {})
+    module.get_build = MagicMock()
+    module.watch_build = MagicMock()
+    return module
+
+
+def _wait(module, phases=("Complete",)):
+    return module.wait_for_build("build-1", "test", phases, 120, 5)
+
+
+def test_wait_for_build_terminal_phase(builds):
+    builds.get_build.return_value = _build("Running")
+    builds.watch_build.return_value = _build("Complete", "2")
+
+    assert _wait(builds) == _build("Complete", "2")
+    builds.watch_build.assert_called_once_with(_build("Running"), ("Complete",), 120)
+    openshift_builds.time.sleep.assert_not_called()
+
+
+def test_wait_for_build_already_in_phase(builds):
+    builds.get_build.return_value = _build("Complete")
+
+    assert _wait(builds) == _build("Complete")
+    builds.watch_build.assert_not_called()
+
+
+def test_wait_for_build_deleted(builds):
+    builds.get_build.return_value = _build("Running")
+    builds.watch_build.return_value = None
+
+    assert _wait(builds) is None
+
+
+def test_wait_for_build_not_found(builds):
+    builds.get_build.return_value = None
+
+    assert _wait(builds) is None
+    builds.watch_build.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        ApiException(status=403, reason="Forbidden"),
+        ProtocolError("Connection broken"),
+        ReadTimeoutError(None, None, "Read timed out."),
+    ],
+)
+def test_wait_for_build_falls_back_to_polling(builds, error):
+    builds.get_build.side_effect = [
+        _build("Running"),
+        _build("Running", "2"),
+        _build("Cancelled", "3"),
+    ]
+    builds.watch_build.side_effect = error
+
+    assert _wait(builds, ("Cancelled",)) == _build("Cancelled", "3")
+    builds.watch_build.assert_called_once()
+    assert builds.get_build.call_count == 3
+    openshift_builds.time.sleep.assert_called_with(5)
+
+
+def test_wait_for_build_timeout(builds, monkeypatch):
+    start = datetime(2021, 1, 1)
+    clock = MagicMock()
+    clock.now.side_effect = [start, start, start + timedelta(seconds=120)]
+    monkeypatch.setattr(openshift_builds, "datetime", clock)
+    builds.get_build.return_value = _build("Running")
+    builds.watch_build.return_value = _build("Running", "2")
+
+    assert _wait(builds) == _build("Running", "2")
+    builds.watch_build.assert_called_once()
+
+
+def test_watch_build_events():
+    module = create_module(OpenShiftBuilds, {})
+    resource = module.find_resource.return_value
+
+    resource.watch.return_value = iter(
+        [
+            {"type": "MODIFIED", "raw_object": _build("Running", "2")},
+            {"type": "MODIFIED", "raw_object": _build("Complete", "3")},
+            {"type": "MODIFIED", "raw_object": _build("Complete", "4")},
+        ]
+    )
+    result = module.watch_build(_build("New"), ("Complete",), 60)
+    assert result == _build("Complete", "3")
+    kwargs = resource.watch.call_args.kwargs
+    assert kwargs["resource_version"] == "1"
+    assert kwargs["timeout"] == 60
+    assert kwargs["name"] == "build-1"
+
+    resource.watch.return_value = iter(
+        [
+            {"type": "MODIFIED", "raw_object": _build("Running", "2")},
+            {"type": "DELETED", "raw_object": _build("Running", "3")},
+        ]
+    )
+    assert module.watch_build(_build("New"), ("Complete",), 60) is None
+
+
+def _start_build_module(phase):
+    module = create_module(
+        OpenShiftBuilds,
+        {
+            "build_config_name": "config",
+            "namespace": "test",
+            "wait": True,
+            "wait_timeout": 120,
+            "wait_sleep": 5,
+        },
+    )
+    module.instantiate_build_config = MagicMock(return_value=_build("New"))
+    module.wait_for_build = MagicMock(return_value=_build(phase, "2"))
+    return module
+
+
+def test_start_build_wait_complete():
+    module = _start_build_module("Complete")
+
+    with pytest.raises(AnsibleExitJson) as result:
+        module.start_build()
+
+    assert result.value.args[0] == {
+        "changed": True,
+        "builds": [_build("Complete", "2")],
+    }
+    module.wait_for_build.assert_called_once_with(
+        "build-1", "test", ("Complete", "Cancelled", "Error", "Failed"), 120, 5
+    )
+
+
+def test_start_build_wait_failed():
+    module = _start_build_module("Failed")
+
+    with pytest.raises(AnsibleFailJson) as result:
+        module.start_build()
+
+    assert (
+        result.value.args[0]["msg"]
+        == "Unexpected status for Build build-1/test: Failed"
+    )
+
+
+def test_cancel_build_wait():
+    module = create_module(
+        OpenShiftBuilds,
+        {
+            "build_name": "build-1",
+            "namespace": "test",
+            "build_phases": [],
+            "wait": True,
+            "wait_timeout": 120,
+            "wait_sleep": 5,
+        },
+    )
+    module.kubernetes_facts.return_value = {"resources": [_build("Running")]}
+    module.client.client.request.return_value.to_dict.return_value = _build(
+        "Running", "2"
+    )
+    module.wait_for_build = MagicMock(return_value=_build("Cancelled", "3"))
+
+    with pytest.raises(AnsibleExitJson) as result:
+        module.cancel_build(restart=False)
+
+    assert result.value.args[0] == {
+        "changed": True,
+        "builds": [_build("Cancelled", "3")],
+    }
+    module.wait_for_build.assert_called_once_with(
+        "build-1", "test", ("Cancelled",), 120, 5
+    )
@@ -0,0 +1,96 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("kubernetes", reason="This test requires the kubernetes library")
+
+from kubernetes.client.rest import ApiException
+from kubernetes.dynamic.exceptions import DynamicApiError
+
+from ansible_collections.redhat.openshift.plugins.module_utils.openshift_import_image import (
+    OpenShiftImportImage,
+)
+from ansible_collections.redhat.openshift.tests.unit.utils.ansible_module_mock import (
+    AnsibleExitJson,
+    AnsibleFailJson,
+    create_module,
+)
+
+
+def _image_stream_import(ref):
+    return {
+        "apiVersion": "image.openshift.io/v1",
+        "kind": "ImageStreamImport",
+        "metadata": {"name": ref["name"], "namespace": "test"},
+        "spec": {"import": True},
+    }
+
+
+def _import_image_module(names, failing=None, check_mode=False):
+    module = create_module(
+        OpenShiftImportImage,
+        {"name": names, "namespace": "test", "all": False, "source": None},
+        check_mode=check_mode,
+    )
+    module.create_image_import = MagicMock(side_effect=_image_stream_import)
+
+    def _create(isi, namespace):
+        name = isi["metadata"]["name"]
+        if name == failing:
+            raise DynamicApiError(ApiException(status=409, reason="Conflict"))
+        return MagicMock(to_dict=MagicMock(return_value={"created": name}))
+
+    resource = module.find_resource.return_value
+    resource.create.side_effect = _create
+    return module
+
+
+def test_import_image_multiple_streams():
+    module = _import_image_module(["stream1", "stream2:v1", "stream3"])
+
+    with pytest.raises(AnsibleExitJson) as result:
+        module.execute_module()
+
+    assert result.value.args[0] == {
+        "changed": True,
+        "result": [
+            {"created": "stream1"},
+            {"created": "stream2"},
+            {"created": "stream3"},
+        ],
+    }
+    assert module.find_resource.return_value.create.call_count == 3
+
+
+def test_import_image_check_mode():
+    module = _import_image_module(["stream1", "stream2"], check_mode=True)
+
+    with pytest.raises(AnsibleExitJson) as result:
+        module.execute_module()
+
+    assert [isi["metadata"]["name"] for isi in result.value.args[0]["result"]] == [
+        "stream1",
+        "stream2",
+    ]
+    module.find_resource.return_value.create.assert_not_called()
+
+
+def test_import_image_failure_reports_created_imports():
+    module = _import_image_module(["stream1", "stream2", "stream3"], failing="stream2")
+
+    with pytest.raises(AnsibleFailJson) as result:
+        module.execute_module()
+
+    failure = result.value.args[0]
+    assert failure["msg"].startswith(
+        "Failed to create object ImageStreamImport/test/stream2 due to:"
+    )
+    assert failure["status"] == 409
+    assert failure["reason"] == "Conflict"
+    assert failure["result"] == [{"created": "stream1"}, {"created": "stream3"}]
+    assert module.find_resource.return_value.create.call_count == 3
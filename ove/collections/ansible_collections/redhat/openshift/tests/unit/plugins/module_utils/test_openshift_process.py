@@ -0,0 +1,95 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+import yaml
+
+from ansible_collections.redhat.openshift.plugins.module_utils import openshift_process
+from ansible_collections.redhat.openshift.plugins.module_utils.openshift_process import (
+    OpenShiftProcess,
+)
+from ansible_collections.redhat.openshift.tests.unit.utils.ansible_module_mock import (
+    create_module,
+)
+
+TEMPLATES = """
+---
+apiVersion: template.openshift.io/v1
+kind: Template
+metadata:
+  name: first
+objects: []
+---
+---
+apiVersion: template.openshift.io/v1
+kind: Template
+metadata:
+  name: second
+  namespace: other
+parameters:
+  - name: NAME
+    value: test
+"""
+
+
+def _params(**kwargs):
+    params = dict(
+        src=None,
+        resource_definition=None,
+        kind=None,
+        name=None,
+        namespace="test",
+        api_version="v1",
+    )
+    params.update(kwargs)
+    return params
+
+
+def test_yaml_loader():
+    assert openshift_process._YAML_LOADER is getattr(
+        yaml, "CSafeLoader", yaml.SafeLoader
+    )
+
+
+def test_set_resource_definitions_from_src(tmp_path, monkeypatch):
+    loaders = []
+    load_all = yaml.load_all
+
+    def _load_all(stream, Loader):
+        loaders.append(Loader)
+        return load_all(stream, Loader=Loader)
+
+    monkeypatch.setattr(openshift_process.yaml, "load_all", _load_all)
+    src = tmp_path / "templates.yml"
+    src.write_text(TEMPLATES)
+    module = create_module(OpenShiftProcess, _params(src=str(src)))
+
+    module.set_resource_definitions()
+
+    assert loaders == [openshift_process._YAML_LOADER]
+
+    assert module.resource_definitions == [
+        {
+            "apiVersion": "template.openshift.io/v1",
+            "kind": "Template",
+            "metadata": {"name": "first", "namespace": "test"},
+            "objects": [],
+        },
+        {
+            "apiVersion": "template.openshift.io/v1",
+            "kind": "Template",
+            "metadata": {"name": "second", "namespace": "other"},
+            "parameters": [{"name": "NAME", "value": "test"}],
+        },
+    ]
+
+
+def test_set_resource_definitions_from_empty_src(tmp_path):
+    src = tmp_path / "empty.yml"
+    src.write_text("---\n")
+    module = create_module(OpenShiftProcess, _params(src=str(src)))
+
+    module.set_resource_definitions()
+
+    assert module.resource_definitions == []
@@ -3,10 +3,17 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 
+from unittest.mock import MagicMock, call
+
 import pytest
 
 from ansible_collections.redhat.openshift.plugins.modules.openshift_adm_migrate_template_instances import (
     OpenShiftMigrateTemplateInstances,
+    migration_patch,
+)
+from ansible_collections.redhat.openshift.tests.unit.utils.ansible_module_mock import (
+    AnsibleExitJson,
+    create_module,
 )
 
 
@@ -227,6 +234,39 @@ testdata = [
             },
             [],
         ),
+        (
+            {
+                "status": {
+                    "objects": [
+                        {"ref": {"kind": "Route", "apiVersion": "v1"}},
+                        {"ref": {"kind": "BuildConfig", "apiVersion": "v1"}},
+                    ]
+                }
+            },
+            [
+                {
+                    "status": {
+                        "objects": [
+                            {
+                                "ref": {
+                                    "kind": "Route",
+                                    "apiVersion": "route.openshift.io/v1",
+                                }
+                            },
+                            {
+                                "ref": {
+                                    "kind": "BuildConfig",
+                                    "apiVersion": "build.openshift.io/v1",
+                                }
+                            },
+                        ]
+                    }
+                }
+            ],
+        ),
+        ({"metadata": {"name": "ti"}}, []),
+        ({"status": {}}, []),
+        ({"kind": "TemplateInstanceList", "items": []}, []),
     ],
 ]
 
@@ -234,3 +274,69 @@ testdata = [
 @pytest.mark.parametrize(*testdata)
 def test_templateinstance_migrations(input, output):
     assert OpenShiftMigrateTemplateInstances.perform_migrations(input) == output
+
+
+def test_templateinstance_migration_patch():
+    templateinstance = {
+        "metadata": {"name": "ti", "resourceVersion": "42"},
+        "status": {
+            "objects": [
+                {"ref": {"kind": "FakeKind", "apiVersion": "v1"}},
+                {"ref": {"kind": "Route", "apiVersion": "route.openshift.io/v1"}},
+            ]
+        },
+    }
+    assert migration_patch(templateinstance) == [
+        {"op": "test", "path": "/metadata/resourceVersion", "value": "42"},
+        {
+            "op": "add",
+            "path": "/status/objects/1/ref/apiVersion",
+            "value": "route.openshift.io/v1",
+        },
+    ]
+
+
+def _templateinstance(name, kind):
+    return {
+        "metadata": {"name": name, "namespace": "test", "resourceVersion": "1"},
+        "status": {"objects": [{"ref": {"kind": kind, "apiVersion": "v1"}}]},
+    }
+
+
+def test_templateinstance_migrations_namespace_paged():
+    resource = MagicMock()
+    resource.get.side_effect = [
+        {
+            "kind": "TemplateInstanceList",
+            "metadata": {"continue": "page-2"},
+            "items": [_templateinstance("ti-1", "Route")],
+        },
+        {
+            "kind": "TemplateInstanceList",
+            "metadata": {},
+            "items": [_templateinstance("ti-2", "BuildConfig")],
+        },
+    ]
+    resource.status.patch.side_effect = lambda **kwargs: MagicMock(
+        to_dict=MagicMock(return_value={"name": kwargs["name"]})
+    )
+
+    module = create_module(OpenShiftMigrateTemplateInstances, {"namespace": "test"})
+    module.find_resource.return_value = resource
+
+    with pytest.raises(AnsibleExitJson) as result:
+        module.execute_module()
+
+    assert result.value.args[0] == {
+        "changed": True,
+        "result": [{"name": "ti-1"}, {"name": "ti-2"}],
+    }
+    assert resource.get.call_args_list == [
+        call(namespace="test", limit=500, _continue=None),
+        call(namespace="test", limit=500, _continue="page-2"),
+    ]
+    patched = {c.kwargs["name"]: c.kwargs for c in resource.status.patch.call_args_list}
+    assert sorted(patched) == ["ti-1", "ti-2"]
+    assert patched["ti-1"]["namespace"] == "test"
+    assert patched["ti-1"]["body"][-1]["value"] == "route.openshift.io/v1"
+    assert patched["ti-2"]["body"][-1]["value"] == "build.openshift.io/v1"
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2021, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Helpers to run the module_utils classes without a real AnsibleModule, for more information see
+# https://docs.ansible.com/ansible/latest/dev_guide/testing_units_modules.html#module-argument-processing
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from unittest.mock import MagicMock
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+
+    pass
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+
+    pass
+
+
+def exit_json(*args, **kwargs):
+    """function to patch over exit_json; package return data into an exception"""
+    if "changed" not in kwargs:
+        kwargs["changed"] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs["failed"] = True
+    raise AnsibleFailJson(kwargs)
+
+
+def create_module(module_class, params, check_mode=False):
+    """Create module_class without connecting to a cluster, using params as module parameters"""
+    module = module_class.__new__(module_class)
+    module._module = MagicMock(
+        params=params, check_mode=check_mode, exit_json=exit_json, fail_json=fail_json
+    )
+    module.fail = module.fail_json
+    module.client = MagicMock()
+    module.find_resource = MagicMock()
+    module.kubernetes_facts = MagicMock()
+    return module